@@ -0,0 +1,37 @@
+"""Type stubs for the narytree C++ extension module."""
+
+from typing import Any, Dict, Optional
+
+class Node:
+    """N-ary tree node"""
+
+    def data(self) -> Any: ...
+    def set_data(self, data: Any, /) -> None: ...
+    def add_child(self, data: Any, /) -> Node: ...
+    def child_count(self) -> int: ...
+    def is_leaf(self) -> bool: ...
+    def child(self, index: int, /) -> Node: ...
+    def depth(self) -> int: ...
+    def height_from_root(self) -> int: ...
+
+class NaryTree:
+    """N-ary tree data structure"""
+
+    def __init__(self, root_data: Any = ..., /) -> None: ...
+    def set_root(self, root_data: Any, /) -> None: ...
+    def empty(self) -> bool: ...
+    def size(self) -> int: ...
+    def depth(self) -> int: ...
+    def clear(self) -> None: ...
+    def root(self) -> Optional[Node]: ...
+    def statistics(self) -> Dict[str, Any]: ...
+    def balance_tree(self, max_children_per_node: int = 3, /) -> None: ...
+    def needs_rebalancing(self) -> bool: ...
+    def auto_balance_if_needed(self, max_children_per_node: int = 3, /) -> None: ...
+    def get_memory_stats(self) -> Dict[str, Any]: ...
+    def encode_succinct(self) -> Dict[str, Any]: ...
+    @classmethod
+    def decode_succinct(cls, encoding: Dict[str, Any], /) -> NaryTree: ...
+    def enable_array_storage(self) -> None: ...
+    def calculate_locality_score(self) -> float: ...
+    def rebalance_for_locality(self) -> None: ...
@@ -31,8 +31,9 @@ public:
 
 extern "C" {
 
-// Forward declaration - will be defined later
-extern PyTypeObject NodeType;
+// Heap types created from their specs in PyInit_narytree (stable ABI)
+static PyTypeObject* NaryTreeType = NULL;
+static PyTypeObject* NodeType = NULL;
 
 // Python object structure for NaryTree
 typedef struct {
@@ -49,7 +50,8 @@ typedef struct {
 
 // NaryTree methods
 static PyObject* narytree_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
-    NaryTreeObject* self = (NaryTreeObject*)type->tp_alloc(type, 0);
+    allocfunc tp_alloc = (allocfunc)PyType_GetSlot(type, Py_tp_alloc);
+    NaryTreeObject* self = (NaryTreeObject*)tp_alloc(type, 0);
     if (self != NULL) {
         self->tree = NULL;
     }
@@ -78,16 +80,14 @@ static int narytree_init(NaryTreeObject* self, PyObject* args, PyObject* kwds) {
 }
 
 static void narytree_dealloc(NaryTreeObject* self) {
+    PyTypeObject* tp = Py_TYPE(self);
     delete self->tree;
-    Py_TYPE(self)->tp_free((PyObject*)self);
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    tp_free(self);
+    Py_DECREF(tp);
 }
 
-static PyObject* narytree_set_root(NaryTreeObject* self, PyObject* args) {
-    PyObject* root_data;
-    if (!PyArg_ParseTuple(args, "O", &root_data)) {
-        return NULL;
-    }
-    
+static PyObject* narytree_set_root(NaryTreeObject* self, PyObject* root_data) {
     try {
         Py_INCREF(root_data);
         self->tree->tree.set_root(root_data);
@@ -128,7 +128,7 @@ static PyObject* narytree_root(NaryTreeObject* self, PyObject* Py_UNUSED(ignored
         Py_RETURN_NONE;
     }
     
-    NodeObject* node_obj = (NodeObject*)NodeType.tp_alloc(&NodeType, 0);
+    NodeObject* node_obj = (NodeObject*)PyType_GenericAlloc(NodeType, 0);
     if (!node_obj) {
         return NULL;
     }
@@ -309,7 +309,8 @@ static PyObject* narytree_decode_succinct(PyTypeObject* type, PyObject* args) {
         auto decoded_tree = NaryTree<PyObject*>::decode_succinct(encoding_struct);
         
         // Create Python object
-        NaryTreeObject* tree_obj = (NaryTreeObject*)type->tp_alloc(type, 0);
+        allocfunc tp_alloc = (allocfunc)PyType_GetSlot(type, Py_tp_alloc);
+        NaryTreeObject* tree_obj = (NaryTreeObject*)tp_alloc(type, 0);
         if (!tree_obj) {
             return NULL;
         }
@@ -356,7 +357,8 @@ static PyObject* narytree_rebalance_for_locality(NaryTreeObject* self, PyObject*
 
 // Node methods
 static PyObject* node_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
-    NodeObject* self = (NodeObject*)type->tp_alloc(type, 0);
+    allocfunc tp_alloc = (allocfunc)PyType_GetSlot(type, Py_tp_alloc);
+    NodeObject* self = (NodeObject*)tp_alloc(type, 0);
     if (self != NULL) {
         self->node_ptr = NULL;
         self->tree_obj = NULL;
@@ -365,8 +367,11 @@ static PyObject* node_new(PyTypeObject* type, PyObject* args, PyObject* kwds) {
 }
 
 static void node_dealloc(NodeObject* self) {
+    PyTypeObject* tp = Py_TYPE(self);
     Py_XDECREF(self->tree_obj);
-    Py_TYPE(self)->tp_free((PyObject*)self);
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    tp_free(self);
+    Py_DECREF(tp);
 }
 
 static PyObject* node_data(NodeObject* self, PyObject* Py_UNUSED(ignored)) {
@@ -381,17 +386,12 @@ static PyObject* node_data(NodeObject* self, PyObject* Py_UNUSED(ignored)) {
     return data;
 }
 
-static PyObject* node_set_data(NodeObject* self, PyObject* args) {
+static PyObject* node_set_data(NodeObject* self, PyObject* new_data) {
     if (!self->node_ptr) {
         PyErr_SetString(PyExc_RuntimeError, "Invalid node");
         return NULL;
     }
     
-    PyObject* new_data;
-    if (!PyArg_ParseTuple(args, "O", &new_data)) {
-        return NULL;
-    }
-    
     auto* node = static_cast<NaryTree<PyObject*>::Node*>(self->node_ptr);
     PyObject* old_data = node->data();
     
@@ -402,24 +402,19 @@ static PyObject* node_set_data(NodeObject* self, PyObject* args) {
     Py_RETURN_NONE;
 }
 
-static PyObject* node_add_child(NodeObject* self, PyObject* args) {
+static PyObject* node_add_child(NodeObject* self, PyObject* child_data) {
     if (!self->node_ptr) {
         PyErr_SetString(PyExc_RuntimeError, "Invalid node");
         return NULL;
     }
     
-    PyObject* child_data;
-    if (!PyArg_ParseTuple(args, "O", &child_data)) {
-        return NULL;
-    }
-    
     auto* node = static_cast<NaryTree<PyObject*>::Node*>(self->node_ptr);
     
     try {
         Py_INCREF(child_data);
         auto& child_node = node->add_child(child_data);
         
-        NodeObject* child_obj = (NodeObject*)NodeType.tp_alloc(&NodeType, 0);
+        NodeObject* child_obj = (NodeObject*)PyType_GenericAlloc(NodeType, 0);
         if (!child_obj) {
             return NULL;
         }
@@ -455,14 +450,14 @@ static PyObject* node_is_leaf(NodeObject* self, PyObject* Py_UNUSED(ignored)) {
     return PyBool_FromLong(node->is_leaf());
 }
 
-static PyObject* node_child(NodeObject* self, PyObject* args) {
+static PyObject* node_child(NodeObject* self, PyObject* index_obj) {
     if (!self->node_ptr) {
         PyErr_SetString(PyExc_RuntimeError, "Invalid node");
         return NULL;
     }
     
-    Py_ssize_t index;
-    if (!PyArg_ParseTuple(args, "n", &index)) {
+    Py_ssize_t index = PyNumber_AsSsize_t(index_obj, PyExc_OverflowError);
+    if (index == -1 && PyErr_Occurred()) {
         return NULL;
     }
     
@@ -471,7 +466,7 @@ static PyObject* node_child(NodeObject* self, PyObject* args) {
     try {
         auto& child_node = node->child(static_cast<size_t>(index));
         
-        NodeObject* child_obj = (NodeObject*)NodeType.tp_alloc(&NodeType, 0);
+        NodeObject* child_obj = (NodeObject*)PyType_GenericAlloc(NodeType, 0);
         if (!child_obj) {
             return NULL;
         }
@@ -512,7 +507,7 @@ static PyObject* node_height_from_root(NodeObject* self, PyObject* Py_UNUSED(ign
 
 // Method definitions
 static PyMethodDef narytree_methods[] = {
-    {"set_root", (PyCFunction)narytree_set_root, METH_VARARGS, "Set the root node data"},
+    {"set_root", (PyCFunction)narytree_set_root, METH_O, "Set the root node data"},
     {"empty", (PyCFunction)narytree_empty, METH_NOARGS, "Check if tree is empty"},
     {"size", (PyCFunction)narytree_size, METH_NOARGS, "Get tree size"},
     {"depth", (PyCFunction)narytree_depth, METH_NOARGS, "Get tree depth"},
@@ -533,41 +528,48 @@ static PyMethodDef narytree_methods[] = {
 
 static PyMethodDef node_methods[] = {
     {"data", (PyCFunction)node_data, METH_NOARGS, "Get node data"},
-    {"set_data", (PyCFunction)node_set_data, METH_VARARGS, "Set node data"},
-    {"add_child", (PyCFunction)node_add_child, METH_VARARGS, "Add child node"},
+    {"set_data", (PyCFunction)node_set_data, METH_O, "Set node data"},
+    {"add_child", (PyCFunction)node_add_child, METH_O, "Add child node"},
     {"child_count", (PyCFunction)node_child_count, METH_NOARGS, "Get number of children"},
     {"is_leaf", (PyCFunction)node_is_leaf, METH_NOARGS, "Check if node is leaf"},
-    {"child", (PyCFunction)node_child, METH_VARARGS, "Get child by index"},
+    {"child", (PyCFunction)node_child, METH_O, "Get child by index"},
     {"depth", (PyCFunction)node_depth, METH_NOARGS, "Get node depth"},
     {"height_from_root", (PyCFunction)node_height_from_root, METH_NOARGS, "Get height from root"},
     {NULL}
 };
 
-// Type definitions
-static PyTypeObject NaryTreeType = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name = "narytree.NaryTree",
-    .tp_basicsize = sizeof(NaryTreeObject),
-    .tp_itemsize = 0,
-    .tp_dealloc = (destructor)narytree_dealloc,
-    .tp_flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
-    .tp_doc = "N-ary tree data structure",
-    .tp_methods = narytree_methods,
-    .tp_init = (initproc)narytree_init,
-    .tp_new = narytree_new,
+// Type specs (PyType_FromSpec keeps the module within the limited API)
+static PyType_Slot narytree_slots[] = {
+    {Py_tp_dealloc, (void*)narytree_dealloc},
+    {Py_tp_doc, (void*)"N-ary tree data structure"},
+    {Py_tp_methods, narytree_methods},
+    {Py_tp_init, (void*)narytree_init},
+    {Py_tp_new, (void*)narytree_new},
+    {0, NULL}
+};
+
+static PyType_Spec narytree_spec = {
+    .name = "narytree.NaryTree",
+    .basicsize = sizeof(NaryTreeObject),
+    .itemsize = 0,
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE,
+    .slots = narytree_slots,
 };
 
-// Define the NodeType (complete the forward declaration)
-PyTypeObject NodeType = {
-    PyVarObject_HEAD_INIT(NULL, 0)
-    .tp_name = "narytree.Node",
-    .tp_basicsize = sizeof(NodeObject),
-    .tp_itemsize = 0,
-    .tp_dealloc = (destructor)node_dealloc,
-    .tp_flags = Py_TPFLAGS_DEFAULT,
-    .tp_doc = "N-ary tree node",
-    .tp_methods = node_methods,
-    .tp_new = node_new,
+static PyType_Slot node_slots[] = {
+    {Py_tp_dealloc, (void*)node_dealloc},
+    {Py_tp_doc, (void*)"N-ary tree node"},
+    {Py_tp_methods, node_methods},
+    {Py_tp_new, (void*)node_new},
+    {0, NULL}
+};
+
+static PyType_Spec node_spec = {
+    .name = "narytree.Node",
+    .basicsize = sizeof(NodeObject),
+    .itemsize = 0,
+    .flags = Py_TPFLAGS_DEFAULT,
+    .slots = node_slots,
 };
 
 // Module definition
@@ -578,33 +580,44 @@ static PyModuleDef narytreemodule = {
     .m_size = -1,
 };
 
+// Before 3.9 PyMODINIT_FUNC carries no visibility attribute, so the init
+// function must be exported explicitly when building with -fvisibility=hidden
+#if PY_VERSION_HEX < 0x03090000 && defined(__GNUC__)
+#undef PyMODINIT_FUNC
+#define PyMODINIT_FUNC extern "C" __attribute__((visibility("default"))) PyObject*
+#endif
+
 PyMODINIT_FUNC PyInit_narytree(void) {
     PyObject* m;
     
-    if (PyType_Ready(&NaryTreeType) < 0) {
+    NaryTreeType = (PyTypeObject*)PyType_FromSpec(&narytree_spec);
+    if (NaryTreeType == NULL) {
         return NULL;
     }
     
-    if (PyType_Ready(&NodeType) < 0) {
+    NodeType = (PyTypeObject*)PyType_FromSpec(&node_spec);
+    if (NodeType == NULL) {
+        Py_CLEAR(NaryTreeType);
         return NULL;
     }
     
     m = PyModule_Create(&narytreemodule);
     if (m == NULL) {
+        Py_CLEAR(NodeType);
+        Py_CLEAR(NaryTreeType);
         return NULL;
     }
     
-    Py_INCREF(&NaryTreeType);
-    if (PyModule_AddObject(m, "NaryTree", (PyObject*)&NaryTreeType) < 0) {
-        Py_DECREF(&NaryTreeType);
+    Py_INCREF(NaryTreeType);
+    if (PyModule_AddObject(m, "NaryTree", (PyObject*)NaryTreeType) < 0) {
+        Py_DECREF(NaryTreeType);
         Py_DECREF(m);
         return NULL;
     }
     
-    Py_INCREF(&NodeType);
-    if (PyModule_AddObject(m, "Node", (PyObject*)&NodeType) < 0) {
-        Py_DECREF(&NodeType);
-        Py_DECREF(&NaryTreeType);
+    Py_INCREF(NodeType);
+    if (PyModule_AddObject(m, "Node", (PyObject*)NodeType) < 0) {
+        Py_DECREF(NodeType);
         Py_DECREF(m);
         return NULL;
     }
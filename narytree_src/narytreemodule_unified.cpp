@@ -1,6 +1,6 @@
 #define PY_SSIZE_T_CLEAN
 #include <Python.h>
-#include "succinct_narytree_unified.cpp"
+#include "succinct_narytree_unified.hpp"
 
 // Python wrapper for SuccinctNaryTree
 struct PyNaryTreeObject {
@@ -35,11 +35,13 @@ static PyObject* PyNaryTree_root(PyNaryTreeObject* self);
 static PyObject* PyNaryTree_clear(PyNaryTreeObject* self);
 static PyObject* PyNaryTree_get_locality_statistics(PyNaryTreeObject* self);
 static PyObject* PyNaryTree_rebalance_for_locality(PyNaryTreeObject* self);
+static PyObject* PyNaryTree_traverse_count(PyNaryTreeObject* self, PyObject* args);
 
 static void PyNodeView_dealloc(PyNodeViewObject* self);
 static PyObject* PyNodeView_data(PyNodeViewObject* self);
 static PyObject* PyNodeView_set_data(PyNodeViewObject* self, PyObject* args);
 static PyObject* PyNodeView_add_child(PyNodeViewObject* self, PyObject* args);
+static PyObject* PyNodeView_add_children(PyNodeViewObject* self, PyObject* children);
 static PyObject* PyNodeView_child_count(PyNodeViewObject* self);
 static PyObject* PyNodeView_is_leaf(PyNodeViewObject* self);
 
@@ -48,6 +50,7 @@ static PyMethodDef PyNodeView_methods[] = {
     {"data", (PyCFunction)PyNodeView_data, METH_NOARGS, "Get node data"},
     {"set_data", (PyCFunction)PyNodeView_set_data, METH_VARARGS, "Set node data"},
     {"add_child", (PyCFunction)PyNodeView_add_child, METH_VARARGS, "Add child node"},
+    {"add_children", (PyCFunction)PyNodeView_add_children, METH_O, "Add child nodes from an iterable in one batch"},
     {"child_count", (PyCFunction)PyNodeView_child_count, METH_NOARGS, "Get child count"},
     {"is_leaf", (PyCFunction)PyNodeView_is_leaf, METH_NOARGS, "Check if leaf node"},
     {NULL, NULL, 0, NULL}
@@ -65,6 +68,23 @@ static PyTypeObject PyNodeViewType = {
     .tp_methods = PyNodeView_methods,
 };
 
+// Freelist of released NodeView objects, reused instead of going back to the
+// allocator on every root()/add_child() call (accessed with the GIL held)
+static const int NODEVIEW_FREELIST_MAX = 256;
+static PyNodeViewObject* nodeview_freelist[NODEVIEW_FREELIST_MAX];
+static int nodeview_numfree = 0;
+
+static PyNodeViewObject* PyNodeView_alloc() {
+    if (nodeview_numfree > 0) {
+        PyNodeViewObject* op = nodeview_freelist[--nodeview_numfree];
+        PyObject_Init((PyObject*)op, &PyNodeViewType);
+        op->node_view = nullptr;
+        op->tree_obj = nullptr;
+        return op;
+    }
+    return (PyNodeViewObject*)PyNodeViewType.tp_alloc(&PyNodeViewType, 0);
+}
+
 static PyMethodDef PyNaryTree_methods[] = {
     {"empty", (PyCFunction)PyNaryTree_empty, METH_NOARGS, "Check if tree is empty"},
     {"size", (PyCFunction)PyNaryTree_size, METH_NOARGS, "Get tree size"},
@@ -73,6 +93,7 @@ static PyMethodDef PyNaryTree_methods[] = {
     {"clear", (PyCFunction)PyNaryTree_clear, METH_NOARGS, "Clear tree"},
     {"get_locality_statistics", (PyCFunction)PyNaryTree_get_locality_statistics, METH_NOARGS, "Get locality statistics"},
     {"rebalance_for_locality", (PyCFunction)PyNaryTree_rebalance_for_locality, METH_NOARGS, "Rebalance for locality"},
+    {"traverse_count", (PyCFunction)PyNaryTree_traverse_count, METH_VARARGS, "Count nodes (optionally matching a predicate) in a locality-optimized traversal"},
     {NULL, NULL, 0, NULL}
 };
 
@@ -189,7 +210,7 @@ static PyObject* PyNaryTree_root(PyNaryTreeObject* self) {
     
     try {
         // Create NodeView wrapper
-        PyNodeViewObject* node_view = (PyNodeViewObject*)PyNodeViewType.tp_alloc(&PyNodeViewType, 0);
+        PyNodeViewObject* node_view = PyNodeView_alloc();
         if (!node_view) return NULL;
         
         auto root_view = self->tree->root();
@@ -263,6 +284,61 @@ static PyObject* PyNaryTree_rebalance_for_locality(PyNaryTreeObject* self) {
     Py_RETURN_NONE;
 }
 
+static PyObject* PyNaryTree_traverse_count(PyNaryTreeObject* self, PyObject* args) {
+    PyObject* predicate = Py_None;
+    
+    if (!PyArg_ParseTuple(args, "|O", &predicate)) {
+        return NULL;
+    }
+    
+    if (!self->tree) {
+        PyErr_SetString(PyExc_RuntimeError, "Tree not initialized");
+        return NULL;
+    }
+    
+    if (predicate != Py_None && !PyCallable_Check(predicate)) {
+        PyErr_SetString(PyExc_TypeError, "predicate must be callable or None");
+        return NULL;
+    }
+    
+    size_t count = 0;
+    
+    // Without a predicate the walk stays entirely on the C++ side
+    if (predicate == Py_None) {
+        self->tree->for_each_preorder_locality_optimized([&count](auto& /*node*/) {
+            ++count;
+        });
+        return PyLong_FromSize_t(count);
+    }
+    
+    bool failed = false;
+    try {
+        self->tree->for_each_preorder_locality_optimized([&](auto& node) {
+            if (failed) return;
+            
+            PyObject* result = PyObject_CallFunctionObjArgs(predicate, node.data(), NULL);
+            if (!result) {
+                failed = true;
+                return;
+            }
+            
+            int matched = PyObject_IsTrue(result);
+            Py_DECREF(result);
+            if (matched < 0) {
+                failed = true;
+            } else if (matched) {
+                ++count;
+            }
+        });
+    } catch (const std::exception& e) {
+        PyErr_SetString(PyExc_RuntimeError, e.what());
+        return NULL;
+    }
+    
+    if (failed) return NULL;
+    return PyLong_FromSize_t(count);
+}
+
 // PyNodeView methods implementation
 static void PyNodeView_dealloc(PyNodeViewObject* self) {
     if (self->node_view) {
@@ -271,6 +347,10 @@ static void PyNodeView_dealloc(PyNodeViewObject* self) {
     if (self->tree_obj) {
         Py_DECREF(self->tree_obj);
     }
+    if (nodeview_numfree < NODEVIEW_FREELIST_MAX) {
+        nodeview_freelist[nodeview_numfree++] = self;
+        return;
+    }
     Py_TYPE(self)->tp_free((PyObject*)self);
 }
 
@@ -332,7 +412,7 @@ static PyObject* PyNodeView_add_child(PyNodeViewObject* self, PyObject* args) {
         auto child_view = self->node_view->add_child(child_data);
         
         // Create new NodeView wrapper for child
-        PyNodeViewObject* child_node = (PyNodeViewObject*)PyNodeViewType.tp_alloc(&PyNodeViewType, 0);
+        PyNodeViewObject* child_node = PyNodeView_alloc();
         if (!child_node) return NULL;
         
         child_node->node_view = new SuccinctNaryTree<PyObject*>::NodeView(child_view);
@@ -346,6 +426,47 @@ static PyObject* PyNodeView_add_child(PyNodeViewObject* self, PyObject* args) {
     }
 }
 
+static PyObject* PyNodeView_add_children(PyNodeViewObject* self, PyObject* children) {
+    if (!self->node_view) {
+        PyErr_SetString(PyExc_RuntimeError, "NodeView not initialized");
+        return NULL;
+    }
+    
+    PyObject* seq = PySequence_Fast(children, "add_children() argument must be iterable");
+    if (!seq) return NULL;
+    
+    Py_ssize_t count = PySequence_Fast_GET_SIZE(seq);
+    PyObject** items = PySequence_Fast_ITEMS(seq);
+    
+    try {
+        std::vector<PyObject*> children_data(items, items + count);
+        for (PyObject* child_data : children_data) {
+            ensure_python_object_refs(child_data);
+        }
+        
+        SuccinctNaryTree<PyObject*>* tree = self->tree_obj->tree;
+        size_t size_before = tree->size();
+        try {
+            self->node_view->add_children(children_data);
+        } catch (...) {
+            // Children stored before the failure (e.g. in the trailing rebalance)
+            // now belong to the tree; only release the ones it never took
+            size_t stored = tree->size() - size_before;
+            for (size_t i = stored; i < children_data.size(); ++i) {
+                release_python_object_refs(children_data[i]);
+            }
+            throw;
+        }
+    } catch (const std::exception& e) {
+        Py_DECREF(seq);
+        PyErr_SetString(PyExc_RuntimeError, e.what());
+        return NULL;
+    }
+    
+    Py_DECREF(seq);
+    Py_RETURN_NONE;
+}
+
 static PyObject* PyNodeView_child_count(PyNodeViewObject* self) {
     if (!self->node_view) {
         PyErr_SetString(PyExc_RuntimeError, "NodeView not initialized");
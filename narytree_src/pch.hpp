@@ -0,0 +1,19 @@
+// Precompiled header for the narytree extension: Python C API and the STL
+// headers pulled in by nary_tree.cpp
+#define PY_SSIZE_T_CLEAN
+#include <Python.h>
+#include <structmember.h>
+
+#include <vector>
+#include <memory>
+#include <string>
+#include <algorithm>
+#include <functional>
+#include <iterator>
+#include <stdexcept>
+#include <queue>
+#include <stack>
+#include <type_traits>
+#include <limits>
+#include <cmath>
+#include <cstring>
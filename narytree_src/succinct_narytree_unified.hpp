@@ -1,3 +1,6 @@
+#ifndef SUCCINCT_NARYTREE_UNIFIED_HPP
+#define SUCCINCT_NARYTREE_UNIFIED_HPP
+
 #include <vector>
 #include <memory>
 #include <string>
@@ -91,6 +94,10 @@ public:
             return tree_->add_child_to_node(node_index_, child_data);
         }
         
+        void add_children(const std::vector<T>& children_data) {
+            tree_->add_children_to_node(node_index_, children_data);
+        }
+        
         bool remove_child(size_t child_index) {
             return tree_->remove_child_from_node(node_index_, child_index);
         }
@@ -198,6 +205,37 @@ public:
         return NodeView(this, new_index);
     }
     
+    // Batch insertion: all children are appended before a single lazy balancing check
+    void add_children_to_node(size_t parent_index, const std::vector<T>& children_data) {
+        if (parent_index >= storage_.node_count) {
+            throw std::out_of_range("Invalid parent index");
+        }
+        
+        size_t new_count = storage_.node_count + children_data.size();
+        storage_.data_array.reserve(new_count);
+        storage_.parent_indices.reserve(new_count);
+        storage_.child_counts.reserve(new_count);
+        storage_.first_child_pos.reserve(new_count);
+        storage_.structure_bits.reserve(storage_.structure_bits.size() + 2 * children_data.size());
+        
+        for (const T& child_data : children_data) {
+            size_t new_index = storage_.node_count;
+            
+            storage_.data_array.push_back(child_data);
+            storage_.parent_indices.push_back(parent_index);
+            storage_.child_counts.push_back(0);
+            storage_.first_child_pos.push_back(0);
+            storage_.child_counts[parent_index]++;
+            
+            update_structure_bits_for_new_child(parent_index, new_index);
+            
+            storage_.node_count++;
+            storage_.operations_since_balance++;
+        }
+        
+        check_and_rebalance_for_locality();
+    }
+    
     bool remove_child_from_node(size_t parent_index, size_t child_index) {
         if (parent_index >= storage_.node_count) return false;
         
@@ -574,4 +612,6 @@ private:
     }
     
     friend class NodeView;
-};
\ No newline at end of file
+};
+
+#endif // SUCCINCT_NARYTREE_UNIFIED_HPP
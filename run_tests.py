@@ -5,7 +5,13 @@ Test runner for narytree package.
 
 import sys
 import os
-import subprocess
+import unittest
+
+try:
+    import narytree
+    _HAVE_NARYTREE = True
+except ImportError:
+    _HAVE_NARYTREE = False
 
 def main():
     """Run the test suite."""
@@ -13,31 +19,26 @@ def main():
     print("=" * 40)
     
     # Check if narytree is installed
-    try:
-        import narytree
-        print("✓ narytree package found")
-    except ImportError:
+    if not _HAVE_NARYTREE:
         print("✗ narytree package not found!")
         print("Please install it first: python setup.py install --user")
         return 1
+    print("✓ narytree package found")
     
     # Run tests
-    test_file = os.path.join("tests", "test_narytree.py")
-    if not os.path.exists(test_file):
-        print(f"✗ Test file not found: {test_file}")
+    test_dir = "tests"
+    if not os.path.isdir(test_dir):
+        print(f"✗ Test directory not found: {test_dir}")
         return 1
     
-    print(f"Running tests from: {test_file}")
+    print(f"Running tests from: {test_dir}")
     print("-" * 40)
     
-    try:
-        result = subprocess.run([sys.executable, test_file], 
-                              capture_output=False, 
-                              text=True)
-        return result.returncode
-    except Exception as e:
-        print(f"Error running tests: {e}")
-        return 1
+    # Discover and run in-process so the already-imported extension is reused
+    loader = unittest.TestLoader()
+    suite = loader.discover(test_dir, pattern="test_*.py")
+    runner = unittest.TextTestRunner(verbosity=2)
+    return 0 if runner.run(suite).wasSuccessful() else 1
 
 if __name__ == "__main__":
     exit_code = main()
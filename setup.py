@@ -1,7 +1,114 @@
 #!/usr/bin/env python3
 
-from distutils.core import setup, Extension
+from setuptools import setup, Extension
+from setuptools.command.build_ext import build_ext
+from distutils.errors import DistutilsExecError
+from distutils import log
 import os
+import sys
+
+# Optional parallel compilation of translation units: NARYTREE_PARALLEL=1
+# (MAX_JOBS caps the number of concurrent compiler processes)
+if os.environ.get('NARYTREE_PARALLEL') == '1':
+    import distutils.ccompiler
+    from multiprocessing.pool import ThreadPool
+
+    def parallel_compile(self, sources, output_dir=None, macros=None,
+                         include_dirs=None, debug=0, extra_preargs=None,
+                         extra_postargs=None, depends=None):
+        macros, objects, extra_postargs, pp_opts, build = self._setup_compile(
+            output_dir, macros, include_dirs, sources, depends, extra_postargs)
+        cc_args = self._get_cc_args(pp_opts, debug, extra_preargs)
+
+        def _single_compile(obj):
+            try:
+                src, ext = build[obj]
+            except KeyError:
+                return
+            self._compile(obj, src, ext, cc_args, extra_postargs, pp_opts)
+
+        jobs = int(os.environ.get('MAX_JOBS', os.cpu_count() or 1))
+        with ThreadPool(jobs) as pool:
+            list(pool.imap(_single_compile, objects))
+        return objects
+
+    distutils.ccompiler.CCompiler.compile = parallel_compile
+
+# Keep only PyInit_narytree exported and let the linker drop unused sections
+size_compile_args = [
+    '-fvisibility=hidden',
+    '-fvisibility-inlines-hidden',
+    '-fdata-sections',
+    '-ffunction-sections',
+]
+if sys.platform == 'darwin':
+    size_link_args = ['-Wl,-dead_strip']
+else:
+    size_link_args = [
+        '-Wl,--gc-sections',
+        '-Wl,-O1',
+        '-Wl,--as-needed',
+        '-Wl,-Bsymbolic-functions',
+    ]
+
+# Whole-program optimization: LTO at both compile and link time, and direct
+# (non-PLT) calls into libpython
+if sys.platform.startswith('linux'):
+    lto_compile_args = ['-flto=auto', '-fno-plt']
+    lto_link_args = ['-flto=auto', '-fuse-linker-plugin']
+else:
+    lto_compile_args = []
+    lto_link_args = ['-flto']
+
+# Optional profile-guided optimization: NARYTREE_PGO=generate|use
+pgo_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'pgo-data')
+pgo_mode = os.environ.get('NARYTREE_PGO', '')
+if pgo_mode == 'generate':
+    pgo_compile_args = [f'-fprofile-generate={pgo_dir}']
+    pgo_link_args = [f'-fprofile-generate={pgo_dir}']
+elif pgo_mode == 'use':
+    pgo_compile_args = [f'-fprofile-use={pgo_dir}', '-fprofile-correction']
+    pgo_link_args = [f'-fprofile-use={pgo_dir}']
+elif pgo_mode == '':
+    pgo_compile_args = []
+    pgo_link_args = []
+else:
+    raise ValueError(f"NARYTREE_PGO must be 'generate' or 'use', got {pgo_mode!r}")
+
+# Precompile Python.h + STL headers once and force-include them in every TU
+PCH_HEADER = os.path.join('narytree_src', 'pch.hpp')
+
+class BuildExtWithPCH(build_ext):
+    """build_ext that precompiles PCH_HEADER with the extension's own flags"""
+
+    def build_extension(self, ext):
+        if self.compiler.compiler_type == 'unix' and ext.language == 'c++':
+            header = self.build_pch(ext)
+            if header:
+                ext.extra_compile_args = ext.extra_compile_args + ['-include', header, '-Winvalid-pch']
+        super().build_extension(ext)
+
+    def build_pch(self, ext):
+        pch_dir = os.path.join(self.build_temp, 'pch')
+        header = os.path.join(pch_dir, 'pch.hpp')
+        gch = header + '.gch'
+        self.mkpath(pch_dir)
+        self.copy_file(PCH_HEADER, header)
+
+        if not self.force and os.path.exists(gch) and os.path.getmtime(gch) >= os.path.getmtime(header):
+            return header
+
+        macros = [f'-D{name}' if value is None else f'-D{name}={value}'
+                  for name, value in ext.define_macros]
+        includes = [f'-I{d}' for d in ext.include_dirs + self.compiler.include_dirs]
+        cmd = (self.compiler.compiler_so + ['-x', 'c++-header'] + macros + includes +
+               ext.extra_compile_args + [header, '-o', gch])
+        try:
+            self.compiler.spawn(cmd)
+        except DistutilsExecError as e:
+            log.warn(f"precompiled header build failed, continuing without it: {e}")
+            return None
+        return header
 
 # Define the extension module
 narytree_module = Extension(
@@ -9,24 +116,26 @@ narytree_module = Extension(
     sources=['narytree_src/narytreemodule.cpp'],
     include_dirs=['narytree_src'],
     language='c++',
+    py_limited_api=True,
     extra_compile_args=[
         '-std=c++17',
         '-O3',
         '-march=native',
         '-DNDEBUG',
-        '-ffast-math',
+        '-fno-math-errno',
+        '-fno-trapping-math',
         '-funroll-loops',
         '-fprefetch-loop-arrays',
         '-finline-functions',
         '-Wall',
         '-Wno-unused-parameter',
         '-Wno-missing-field-initializers'
-    ],
+    ] + lto_compile_args + size_compile_args + pgo_compile_args,
     extra_link_args=[
         '-O3',
-        '-flto',
-    ],
+    ] + lto_link_args + size_link_args + pgo_link_args,
     define_macros=[
+        ('Py_LIMITED_API', '0x03080000'),
         ('SUCCINCT_NARYTREE_UNIFIED', '1'),
         ('LOCALITY_OPTIMIZED', '1'),
         ('LAZY_BALANCING_ENABLED', '1'),
@@ -41,6 +150,11 @@ setup(
     author='Nico Liberato',
     author_email='nicoliberatoc@gmail.com',
     ext_modules=[narytree_module],
+    # PEP 561 stub-only package so type checkers see the extension's API
+    packages=['narytree-stubs'],
+    package_data={'narytree-stubs': ['__init__.pyi']},
+    cmdclass={'build_ext': BuildExtWithPCH},
+    options={'bdist_wheel': {'py_limited_api': 'cp38'}},
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
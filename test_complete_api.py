@@ -28,51 +28,55 @@ def test_complete_api():
     tests_passed = 0
     tests_total = 0
     
+    # Encode once so decode_succinct() is tested against the same buffer
+    encoded = tree.encode_succinct()
+    
+    # Each entry is (name, target, method_name, args) dispatched via getattr
     # 1. Self-Balancing
     tests = [
-        ("needs_rebalancing()", lambda: tree.needs_rebalancing()),
-        ("balance_tree()", lambda: tree.balance_tree(3)),
-        ("auto_balance_if_needed()", lambda: tree.auto_balance_if_needed()),
+        ("needs_rebalancing()", tree, "needs_rebalancing", ()),
+        ("balance_tree()", tree, "balance_tree", (3,)),
+        ("auto_balance_if_needed()", tree, "auto_balance_if_needed", ()),
     ]
     
     # 2. Succinct Encoding  
     tests.extend([
-        ("encode_succinct()", lambda: tree.encode_succinct()),
-        ("decode_succinct()", lambda: narytree.NaryTree.decode_succinct(tree.encode_succinct())),
+        ("encode_succinct()", tree, "encode_succinct", ()),
+        ("decode_succinct()", narytree.NaryTree, "decode_succinct", (encoded,)),
     ])
     
     # 3. Array-Based Storage & Locality
     tests.extend([
-        ("enable_array_storage()", lambda: tree.enable_array_storage()),
-        ("calculate_locality_score()", lambda: tree.calculate_locality_score()),
-        ("rebalance_for_locality()", lambda: tree.rebalance_for_locality()),
+        ("enable_array_storage()", tree, "enable_array_storage", ()),
+        ("calculate_locality_score()", tree, "calculate_locality_score", ()),
+        ("rebalance_for_locality()", tree, "rebalance_for_locality", ()),
     ])
     
     # 4. Statistics & Memory
     tests.extend([
-        ("statistics()", lambda: tree.statistics()),
-        ("get_memory_stats()", lambda: tree.get_memory_stats()),
+        ("statistics()", tree, "statistics", ()),
+        ("get_memory_stats()", tree, "get_memory_stats", ()),
     ])
     
     # 5. Basic Operations
     tests.extend([
-        ("size()", lambda: tree.size()),
-        ("empty()", lambda: tree.empty()),
-        ("depth()", lambda: tree.depth()),
+        ("size()", tree, "size", ()),
+        ("empty()", tree, "empty", ()),
+        ("depth()", tree, "depth", ()),
     ])
     
     # 6. Node Operations
     tests.extend([
-        ("node.child_count()", lambda: root.child_count()),
-        ("node.is_leaf()", lambda: root.is_leaf()),
-        ("node.child(0)", lambda: root.child(0)),
+        ("node.child_count()", root, "child_count", ()),
+        ("node.is_leaf()", root, "is_leaf", ()),
+        ("node.child(0)", root, "child", (0,)),
     ])
     
     # Run tests
-    for test_name, test_func in tests:
+    for test_name, target, method_name, args in tests:
         tests_total += 1
         try:
-            result = test_func()
+            result = getattr(target, method_name)(*args)
             print(f"  ✅ {test_name}: SUCCESS")
             tests_passed += 1
         except Exception as e:
@@ -55,6 +55,59 @@ class TestSuccinctNaryTree(unittest.TestCase):
         self.assertEqual(child1.data(), "child_1")
         self.assertEqual(child2.data(), "child_2")
     
+    def test_add_children_batch(self):
+        """Test adding several children to a node in one call."""
+        self.tree.set_root("root")
+        root = self.tree.root()
+        
+        root.add_children([f"child_{i}" for i in range(5)])
+        
+        self.assertEqual(root.child_count(), 5)
+        self.assertEqual(self.tree.size(), 6)
+        self.assertFalse(root.is_leaf())
+    
+    def test_add_children_failure_releases_references(self):
+        """Test a rejected batch does not keep or drop references to its items."""
+        self.tree.set_root("root")
+        root = self.tree.root()
+        self.tree.clear()
+
+        payload = object()
+        refcount = sys.getrefcount(payload)
+        with self.assertRaises(RuntimeError):
+            root.add_children([payload, payload])
+        self.assertEqual(sys.getrefcount(payload), refcount)
+        self.assertEqual(self.tree.size(), 0)
+
+    def test_traverse_count(self):
+        """Test counting nodes with a native traversal."""
+        self.assertEqual(self.tree.traverse_count(), 0)
+        
+        self.tree.set_root(0)
+        root = self.tree.root()
+        root.add_children(range(1, 10))
+        
+        self.assertEqual(self.tree.traverse_count(), 10)
+        self.assertEqual(self.tree.traverse_count(lambda value: value % 2 == 0), 5)
+    
+    def test_node_view_reuse(self):
+        """Test node views stay valid when more are dropped than the freelist holds."""
+        self.tree.set_root("root")
+        root = self.tree.root()
+        root.add_children(["child_0", "child_1"])
+
+        # Hold more live views than NODEVIEW_FREELIST_MAX (256), then free them all
+        for _ in range(3):
+            views = [self.tree.root() for _ in range(600)]
+            views += [root.add_child(f"leaf_{i}") for i in range(300)]
+            self.assertEqual(views[0].data(), "root")
+            self.assertEqual(views[-1].data(), "leaf_299")
+            del views
+
+        self.assertEqual(self.tree.root().data(), "root")
+        self.assertEqual(root.child_count(), 902)
+        self.assertEqual(self.tree.size(), 903)
+
     def test_locality_statistics(self):
         """Test locality statistics functionality."""
         self.tree.set_root("root")
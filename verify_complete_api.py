@@ -4,139 +4,226 @@ Comprehensive API verification for the complete N-ary Tree implementation
 Tests all documented methods from README_NARY_TREE_API.md
 """
 
+import functools
+import glob
+import importlib.util
+import io
+import os
+import shutil
+import sys
+
+from setuptools import setup, Extension
+
+# Static lines of the success summary
+_SUMMARY = (
+    "   • Tree operations: ✅ Complete",
+    "   • Node operations: ✅ Complete",
+    "   • Balancing methods: ✅ Found (needs_rebalancing, balance_tree, auto_balance_if_needed)",
+    "   • Succinct encoding: ✅ Found (encode_succinct, decode_succinct)",
+    "   • Memory statistics: ✅ Complete",
+    "   • Statistics: ✅ Complete",
+)
+
+# Grandchild payloads, formatted once at import
+_NAMES_A = tuple(f"grandchild_{i}" for i in range(5))
+_NAMES_B = tuple(f"grandchild_alt_{i}" for i in range(5))
+
+def _load_module(so_path):
+    """Load the built extension from so_path.
+    
+    The artifact is named narytree_complete so it cannot shadow an installed
+    narytree, but narytreemodule.cpp exports PyInit_narytree, so it is loaded
+    under that module name without being registered in sys.modules.
+    """
+    spec = importlib.util.spec_from_file_location('narytree', so_path)
+    if spec is None:
+        raise ImportError(f"{so_path} is not a loadable extension module")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+@functools.lru_cache(maxsize=None)
+def _mtime(path):
+    """Modification time of path, looked up once per verifier run"""
+    return os.path.getmtime(path)
+
+def _needs_rebuild(so_path, srcs):
+    """Return True if the built module is missing or older than any source"""
+    if so_path is None or not os.path.exists(so_path):
+        return True
+    built = _mtime(so_path)
+    return any(_mtime(src) > built for src in srcs)
+
+def _build(tree):
+    """Populate the tree with all of its children in one pass"""
+    root = tree.root()
+    child1 = root.add_child("child_1")
+    child2 = root.add_child("child_2")
+    for a, b in zip(_NAMES_A, _NAMES_B):
+        child1.add_child(a)
+        child2.add_child(b)
+    return root, child1, child2
+
+def _collect_and_check(module, tree, root, child1, child2):
+    """Exercise the documented API on the built tree and return the measured values"""
+    # Node-level queries run before balancing, which may rebuild the nodes
+    results = {
+        'root': root.data(),
+        'root_children': root.child_count(),
+        'first_child': root.child(0).data(),
+        'child1_children': child1.child_count(),
+        'root_is_leaf': root.is_leaf(),
+        'child1_is_leaf': child1.is_leaf(),
+        'statistics': tree.statistics(),
+        'size': tree.size(),
+        'depth': tree.depth(),
+        'empty': tree.empty(),
+        'needs_rebalancing': tree.needs_rebalancing(),
+    }
+    # Explicit raises so the checks still run under python -O
+    if results['root'] != "root_data":
+        raise AssertionError(f"unexpected root data {results['root']!r}")
+    if results['root_children'] != 2:
+        raise AssertionError(f"expected 2 children, got {results['root_children']}")
+    if results['first_child'] != "child_1":
+        raise AssertionError(f"unexpected first child {results['first_child']!r}")
+    if results['child1_children'] != len(_NAMES_A):
+        raise AssertionError(f"expected {len(_NAMES_A)} grandchildren, got {results['child1_children']}")
+    
+    tree.auto_balance_if_needed(3)
+    tree.balance_tree(3)
+    
+    encoding = tree.encode_succinct()
+    results['encoding_type'] = type(encoding)
+    results['encoded_nodes'] = len(encoding.get('data_array', []))
+    results['decoded_size'] = module.NaryTree.decode_succinct(encoding).size()
+    results['memory_stats'] = tree.get_memory_stats()
+    return results
+
+def _render(report, results):
+    """Write the verification report for the measured values"""
+    report.write("\n📋 Testing Documented API Methods:\n")
+    report.write("✅ Tree creation: PASS\n")
+    report.write(f"✅ root(): {results['root']}\n")
+    report.write(f"✅ add_child(): {results['root_children']} children\n")
+    report.write(f"✅ child(index): {results['first_child']}\n")
+    report.write(f"✅ statistics(): {results['statistics']}\n")
+    report.write(f"✅ size(): {results['size']}\n")
+    report.write(f"✅ depth(): {results['depth']}\n")
+    report.write(f"✅ empty(): {results['empty']}\n")
+    report.write(f"✅ needs_rebalancing(): {results['needs_rebalancing']}\n")
+    report.write("✅ auto_balance_if_needed(): PASS\n")
+    report.write("✅ balance_tree(): PASS\n")
+    report.write(f"✅ encode_succinct(): {results['encoding_type']} with {results['encoded_nodes']} nodes\n")
+    report.write(f"✅ decode_succinct(): Tree with {results['decoded_size']} nodes\n")
+    report.write(f"✅ get_memory_stats(): {results['memory_stats']}\n")
+    
+    report.write("\n🔍 Testing Node-Level API (from documentation):\n")
+    report.write(f"✅ Node.child_count(): {results['child1_children']}\n")
+    report.write(f"✅ Node.is_leaf(): root={results['root_is_leaf']}, child1={results['child1_is_leaf']}\n")
+    
+    # Note: Node-level traversals (for_each_preorder, etc.) exist in C++ but
+    # may not be exposed to Python in the current module wrapper
+    
+    report.write("\n🎉 ALL DOCUMENTED API METHODS VERIFIED!\n")
+    report.write("📊 Complete Implementation Summary:\n")
+    report.write("\n".join(_SUMMARY) + "\n")
+
 def verify_complete_implementation():
     """Test the complete implementation with all documented API methods"""
     print("🔍 Testing COMPLETE N-ary Tree Implementation")
     print("=" * 60)
     
+    # Drop mtimes cached by an earlier call in the same process
+    _mtime.cache_clear()
+    
+    # Results are collected here and written in one go once the run finishes
+    report = io.StringIO()
+    succeeded = False
+    # CI can build once and point every verifier job at the same artifact
+    prebuilt = os.environ.get('NARYTREE_PREBUILT_SO')
     try:
-        # Build the complete module temporarily
-        import subprocess
-        import os
-        
-        # Create a test setup.py for the complete implementation
-        test_setup = '''
-from distutils.core import setup, Extension
-
-# Use the complete implementation
-narytree_module = Extension(
-    'narytree_complete',
-    sources=['narytree_src/narytreemodule.cpp'],
-    include_dirs=['narytree_src'],
-    language='c++',
-    extra_compile_args=['-std=c++17', '-O3'],
-)
-
-setup(
-    name='narytree_complete',
-    ext_modules=[narytree_module],
-)
-'''
-        
-        # Write temporary setup file
-        with open('setup_complete.py', 'w') as f:
-            f.write(test_setup)
-        
-        # Build the complete implementation
-        result = subprocess.run(['python3', 'setup_complete.py', 'build_ext', '--inplace'], 
-                              capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            print(f"❌ Build failed: {result.stderr}")
-            return False
-        
-        # Import and test the complete implementation
-        import narytree_complete
-        
-        print("✅ Complete implementation built successfully!")
-        
-        # Test all documented API methods
-        print("\n📋 Testing Documented API Methods:")
-        
-        # 1. Tree creation and basic operations
+        if prebuilt:
+            narytree_complete = _load_module(prebuilt)
+            report.write(f"✅ Using prebuilt artifact: {prebuilt}\n")
+        else:
+            # Serve unchanged objects from ccache across repeated verifier runs
+            if shutil.which('ccache'):
+                os.environ.setdefault('CC', 'ccache cc')
+                os.environ.setdefault('CXX', 'ccache c++')
+            
+            # Build the complete implementation in-process
+            narytree_module = Extension(
+                'narytree_complete',
+                sources=['narytree_src/narytreemodule.cpp'],
+                include_dirs=['narytree_src'],
+                language='c++',
+                py_limited_api=True,
+                define_macros=[('Py_LIMITED_API', '0x03080000')],
+                extra_compile_args=['-std=c++17', '-O3', '-flto', '-march=native',
+                                    '-fno-plt', '-fvisibility=hidden'],
+                extra_link_args=['-flto'],
+            )
+            
+            # Reuse the module from a previous run unless a source has changed
+            built = glob.glob('narytree_complete*.so')
+            srcs = glob.glob('narytree_src/*.[ch]pp')
+            if _needs_rebuild(built[0] if built else None, srcs):
+                saved_argv = sys.argv[:]
+                try:
+                    setup(
+                        name='narytree_complete',
+                        ext_modules=[narytree_module],
+                        packages=[],
+                        script_args=['build_ext', '--inplace', '-j', str(os.cpu_count() or 1)],
+                    )
+                except SystemExit as e:
+                    report.write(f"❌ Build failed: {e}\n")
+                    return False
+                finally:
+                    sys.argv = saved_argv
+            else:
+                report.write("✅ Built module is up to date, skipping rebuild\n")
+            
+            # Import and test the complete implementation
+            built = glob.glob('narytree_complete*.so')
+            if not built:
+                raise ImportError("build produced no narytree_complete extension")
+            narytree_complete = _load_module(built[0])
+            
+            report.write("✅ Complete implementation built successfully!\n")
+        
+        # Mutate first, then query, then format
         tree = narytree_complete.NaryTree("root_data")
-        print("✅ Tree creation: PASS")
-        
-        # 2. Root access
-        root = tree.root()
-        print(f"✅ root(): {root.data()}")
-        
-        # 3. Child management
-        child1 = root.add_child("child_1")
-        child2 = root.add_child("child_2") 
-        print(f"✅ add_child(): {root.child_count()} children")
-        
-        # 4. Child access by index
-        first_child = root.child(0)
-        print(f"✅ child(index): {first_child.data()}")
-        
-        # 5. Tree statistics and properties
-        stats = tree.statistics()
-        print(f"✅ statistics(): {stats}")
-        
-        # 6. Tree size and depth
-        print(f"✅ size(): {tree.size()}")
-        print(f"✅ depth(): {tree.depth()}")
-        print(f"✅ empty(): {tree.empty()}")
-        
-        # 7. Balancing methods (THE MISSING ONES!)
-        print(f"✅ needs_rebalancing(): {tree.needs_rebalancing()}")
-        tree.auto_balance_if_needed(3)
-        print("✅ auto_balance_if_needed(): PASS")
-        tree.balance_tree(3)
-        print("✅ balance_tree(): PASS")
-        
-        # 8. Succinct encoding/decoding (THE MISSING ONES!)
-        encoding = tree.encode_succinct()
-        print(f"✅ encode_succinct(): {type(encoding)} with {len(encoding.get('data_array', []))} nodes")
-        
-        decoded_tree = narytree_complete.NaryTree.decode_succinct(encoding)
-        print(f"✅ decode_succinct(): Tree with {decoded_tree.size()} nodes")
-        
-        # 9. Memory statistics
-        mem_stats = tree.get_memory_stats()
-        print(f"✅ get_memory_stats(): {mem_stats}")
-        
-        # 10. Node-level operations that should exist
-        print("\n🔍 Testing Node-Level API (from documentation):")
-        
-        # Add more children for testing traversals
-        for i in range(5):
-            child1.add_child(f"grandchild_{i}")
-            child2.add_child(f"grandchild_alt_{i}")
-        
-        print(f"✅ Node.child_count(): {child1.child_count()}")
-        print(f"✅ Node.is_leaf(): root={root.is_leaf()}, child1={child1.is_leaf()}")
-        
-        # Note: Node-level traversals (for_each_preorder, etc.) exist in C++ but
-        # may not be exposed to Python in the current module wrapper
-        
-        print("\n🎉 ALL DOCUMENTED API METHODS VERIFIED!")
-        print("📊 Complete Implementation Summary:")
-        print(f"   • Tree operations: ✅ Complete")
-        print(f"   • Node operations: ✅ Complete") 
-        print(f"   • Balancing methods: ✅ Found (needs_rebalancing, balance_tree, auto_balance_if_needed)")
-        print(f"   • Succinct encoding: ✅ Found (encode_succinct, decode_succinct)")
-        print(f"   • Memory statistics: ✅ Complete")
-        print(f"   • Statistics: ✅ Complete")
+        nodes = _build(tree)
+        results = _collect_and_check(narytree_complete, tree, *nodes)
+        _render(report, results)
         
+        succeeded = True
         return True
         
     except ImportError as e:
-        print(f"❌ Import failed: {e}")
-        print("💡 This is expected - we need to integrate the complete implementation")
+        report.write(f"❌ Import failed: {e}\n")
+        report.write("💡 This is expected - we need to integrate the complete implementation\n")
         return False
     except Exception as e:
-        print(f"❌ Test failed: {e}")
+        report.write(f"❌ Test failed: {e}\n")
         return False
     finally:
-        # Cleanup
-        import glob
-        for f in glob.glob('setup_complete.py') + glob.glob('narytree_complete*.so'):
-            try:
-                os.remove(f)
-            except:
-                pass
+        sys.stdout.write(report.getvalue())
+        sys.stdout.flush()
+        
+        # Keep a working module for the next run; drop it only after a failure
+        if not succeeded and not prebuilt:
+            with os.scandir('.') as entries:
+                victims = [entry.path for entry in entries
+                           if entry.name.startswith('narytree_complete')
+                           and entry.name.endswith('.so')]
+            for path in victims:
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
 
 if __name__ == "__main__":
     verify_complete_implementation()
\ No newline at end of file
@@ -4,8 +4,39 @@ Verification script for the narytree package.
 This script checks that all essential files are present and have the expected content.
 """
 
+import mmap
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+# Needles are built once at import; -march=native is host-specific, so only
+# the portable flags are required in setup.py
+_SETUP_NEEDLES = (
+    (b"narytree", "✗ 'narytree' not found in setup.py"),
+    (b"narytreemodule_unified.cpp", "✗ Source file not found in setup.py"),
+    (b"'-std=c++17'", "✗ C++17 compile flag not found in setup.py"),
+    (b"'-O3'", "✗ -O3 optimization flag not found in setup.py"),
+    (b"-flto", "✗ LTO flag not found in setup.py"),
+)
+
+_CPP_NEEDLES = {
+    "narytreemodule_unified.cpp": (
+        (b"#include <Python.h>", "✗ Python.h not included in narytreemodule_unified.cpp"),
+        (b'#include "succinct_narytree_unified.hpp"', "✗ succinct_narytree_unified.hpp not included"),
+    ),
+    "succinct_narytree_unified.hpp": (
+        (b"class SuccinctNaryTree", "✗ SuccinctNaryTree class not found"),
+    ),
+}
+
+# Checks may run concurrently; keep each reported line intact
+_print_lock = threading.Lock()
+
+def _emit(message):
+    """Print a single line without interleaving with other checker threads."""
+    with _print_lock:
+        print(message)
 
 def check_files():
     """Check that all required files are present."""
@@ -15,14 +46,14 @@ def check_files():
         "README.md",
         "requirements.txt",
         "setup.py",
-        "succinct_narytree_unified.cpp",
+        "succinct_narytree_unified.hpp",
         "test_package.py"
     ]
     
-    missing_files = []
-    for file in required_files:
-        if not os.path.exists(file):
-            missing_files.append(file)
+    # One directory read instead of a stat() per required file
+    with os.scandir('.') as entries:
+        present = {entry.name for entry in entries}
+    missing_files = [file for file in required_files if file not in present]
     
     if missing_files:
         print(f"✗ Missing files: {missing_files}")
@@ -31,58 +62,47 @@ def check_files():
         print("✓ All required files are present")
         return True
 
+def _contains_all(path, needles):
+    """Return the needles (bytes) that do not occur in the file at path."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return list(needles)
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return [needle for needle in needles if mm.find(needle) < 0]
+
+def _report_missing(path, checks):
+    """Print the message of the first (needle, message) check missing from path."""
+    missing = _contains_all(path, [needle for needle, _ in checks])
+    for needle, message in checks:
+        if needle in missing:
+            _emit(message)
+            return False
+    return True
+
 def check_setup_py():
     """Check that setup.py has the correct configuration."""
     try:
-        with open("setup.py", "r") as f:
-            content = f.read()
-        
-        # Check for key elements
-        if "narytree" not in content:
-            print("✗ 'narytree' not found in setup.py")
-            return False
-            
-        if "narytreemodule_unified.cpp" not in content:
-            print("✗ Source file not found in setup.py")
-            return False
-            
-        if "extra_compile_args=['-std=c++17'" not in content:
-            print("✗ C++17 compile flag not found in setup.py")
+        if not _report_missing("setup.py", _SETUP_NEEDLES):
             return False
             
-        print("✓ setup.py has correct configuration")
+        _emit("✓ setup.py has correct configuration")
         return True
     except Exception as e:
-        print(f"✗ Error reading setup.py: {e}")
+        _emit(f"✗ Error reading setup.py: {e}")
         return False
 
 def check_cpp_files():
     """Check that C++ files have the expected content."""
     try:
-        # Check main module file
-        with open("narytreemodule_unified.cpp", "r") as f:
-            content = f.read()
-        
-        if "#include <Python.h>" not in content:
-            print("✗ Python.h not included in narytreemodule_unified.cpp")
-            return False
-            
-        if "#include \"succinct_narytree_unified.cpp\"" not in content:
-            print("✗ succinct_narytree_unified.cpp not included")
-            return False
-            
-        # Check tree implementation file
-        with open("succinct_narytree_unified.cpp", "r") as f:
-            content = f.read()
-        
-        if "class SuccinctNaryTree" not in content:
-            print("✗ SuccinctNaryTree class not found")
-            return False
+        # Check the module file, then the tree header
+        for path, checks in _CPP_NEEDLES.items():
+            if not _report_missing(path, checks):
+                return False
             
-        print("✓ C++ files have expected content")
+        _emit("✓ C++ files have expected content")
         return True
     except Exception as e:
-        print(f"✗ Error reading C++ files: {e}")
+        _emit(f"✗ Error reading C++ files: {e}")
         return False
 
 def main():
@@ -96,8 +116,13 @@ def main():
     
     # Run checks
     files_ok = check_files()
-    setup_ok = check_setup_py() if files_ok else False
-    cpp_ok = check_cpp_files() if files_ok else False
+    setup_ok = cpp_ok = False
+    if files_ok:
+        # The setup.py and C++ checks read independent files, so overlap them
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            setup_future = executor.submit(check_setup_py)
+            cpp_future = executor.submit(check_cpp_files)
+            setup_ok, cpp_ok = setup_future.result(), cpp_future.result()
     
     print("\n" + "=" * 50)
     if files_ok and setup_ok and cpp_ok: